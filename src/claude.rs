@@ -31,6 +31,14 @@ pub enum ClaudeMessage {
         working_dir: String,
         is_ipc: bool,
     },
+    // Result of the background Ollama check for whether a finished response needs coordination
+    CoordinationAnalysisComplete {
+        analysis_id: Uuid,
+        main_instance_id: Uuid,
+        claude_message: String,
+        user_context: String,
+        beneficial: bool,
+    },
     // Inter-Veda coordination message
     CoordinationMessage { 
         message: crate::shared_ipc::VedaCoordinationMessage,
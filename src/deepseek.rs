@@ -1,9 +1,9 @@
 use anyhow::Result;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
-use reqwest;
 use tokio::sync::mpsc;
 use futures_util::StreamExt;
+use std::sync::OnceLock;
 
 #[derive(Debug, Clone, Serialize)]
 #[allow(dead_code)]
@@ -31,6 +31,20 @@ struct OllamaStreamResponse {
     done: bool,
 }
 
+/// Shared HTTP client for Ollama and MCP calls.
+///
+/// Reusing one client keeps a pool of keep-alive connections to the local
+/// Ollama server instead of paying a fresh TCP connect for every prompt.
+pub fn http_client() -> &'static reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(|| {
+        reqwest::Client::builder()
+            .pool_max_idle_per_host(4)
+            .build()
+            .expect("failed to build shared reqwest client")
+    })
+}
+
 #[derive(Debug, Clone)]
 pub enum DeepSeekMessage {
     Start { is_thinking: bool },
@@ -122,7 +136,7 @@ Your response (one line only):"#,
         "stream": false
     });
     
-    let client = reqwest::Client::new();
+    let client = http_client();
     let response = client
         .post("http://localhost:11434/api/generate")
         .json(&request_body)
@@ -243,7 +257,7 @@ MESSAGE_TO_CLAUDE_WITH_VERDICT:"#,
     });
     
     // Make HTTP request to Ollama API
-    let client = reqwest::Client::new();
+    let client = http_client();
     let response = client
         .post("http://localhost:11434/api/generate")
         .json(&request_body)
@@ -456,7 +470,7 @@ async fn get_taskmaster_docs() -> Result<String> {
 /// Call DeepWiki via SSE endpoint (as per MCP config)
 #[allow(dead_code)]
 async fn call_deepwiki_mcp(method: &str, params: &serde_json::Value) -> Result<String> {
-    let client = reqwest::Client::new();
+    let client = http_client();
     
     // Construct MCP JSON-RPC request for SSE
     let request_body = json!({
@@ -641,7 +655,7 @@ Important instructions:
     });
     
     // Make HTTP request to Ollama API
-    let client = reqwest::Client::new();
+    let client = http_client();
     let response = client
         .post("http://localhost:11434/api/generate")
         .json(&request_body)
@@ -784,7 +798,7 @@ Important instructions:
     });
     
     // Make HTTP request to Ollama API
-    let client = reqwest::Client::new();
+    let client = http_client();
     let response = client
         .post("http://localhost:11434/api/generate")
         .json(&request_body)
@@ -331,6 +331,8 @@ struct App {
     coordination_enabled: bool,
     max_instances: usize,
     coordination_in_progress: bool,
+    // Background coordination analysis that currently owns coordination_in_progress
+    coordination_analysis_id: Option<Uuid>,
     // Rate limiting for coordination skip log
     last_coordination_skip_log: Option<std::time::Instant>,
     // Message queue system (like Claude Code)
@@ -521,7 +523,7 @@ Your response:"#,
             "stream": false
         });
         
-        let client = reqwest::Client::new();
+        let client = crate::deepseek::http_client();
         let response = client
             .post("http://localhost:11434/api/generate")
             .json(&request_body)
@@ -597,6 +599,7 @@ Your response:"#,
             coordination_enabled: true,
             max_instances: 5, // Main + 4 additional
             coordination_in_progress: false,
+            coordination_analysis_id: None,
             last_coordination_skip_log: None,
             message_queue: Vec::new(),
             enter_press_count: 0,
@@ -1713,282 +1716,43 @@ This prompt appears only once per session. You now have full access to these pow
                         }
                     };
                     
+                    // Set when coordination starts or its analysis is still running
+                    let mut coordination_pending = false;
+                    
                     // Now handle coordination analysis without borrowing conflicts
-                    if let (Some(ref claude_message), Some(ref user_context)) = (claude_message_opt, user_context_opt) {
+                    if let (Some(claude_message), Some(user_context)) = (claude_message_opt, user_context_opt) {
                         tracing::info!("Processing StreamEnd - coordination enabled: {}, current instances: {}, max: {}", 
                                       self.coordination_enabled, self.instances.len(), self.max_instances);
                         
                         // Check if this task would benefit from coordination (only if not already coordinating)
-                        if !self.coordination_in_progress {
-                            if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
-                                instance.add_message("System".to_string(), 
-                                    "🤖 Analyzing if task would benefit from multi-instance coordination...".to_string());
-                            }
-                            
-                            if self.analyze_task_for_coordination(&claude_message).await {
-                                tracing::info!("Task identified for multi-instance coordination");
-                                
-                                // Set coordination in progress to prevent stall detection interference
-                                self.coordination_in_progress = true;
-                            
-                            // Set a safety timeout to clear coordination flag in case something goes wrong
-                            let tx_safety = self.message_tx.clone();
-                            tokio::spawn(async move {
-                                tokio::time::sleep(tokio::time::Duration::from_secs(300)).await; // 5 minutes safety timeout
-                                tracing::warn!("Coordination timeout - clearing coordination_in_progress flag");
-                                // Send a dummy message to trigger flag clearing if needed
-                                let _ = tx_safety.send(ClaudeMessage::InternalCoordinateInstances {
-                                    main_instance_id: uuid::Uuid::new_v4(),
-                                    task_description: "TIMEOUT: Coordination safety timeout triggered".to_string(),
-                                    num_instances: 0,
-                                    working_dir: ".".to_string(),
-                                    is_ipc: false,
-                                }).await;
-                            });
-                            
-                            // Clone necessary data for the background task
-                            let task_desc_clone = claude_message.clone();
-                            let current_dir = if let Some(instance) = self.instances.iter().find(|i| i.id == main_instance_id) {
-                                instance.working_directory.clone()
-                            } else {
-                                std::env::current_dir().map(|p| p.display().to_string()).unwrap_or_else(|_| ".".to_string())
-                            };
-                            let tx = self.message_tx.clone();
-                            
-                            // Show processing message
-                            if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
-                                instance.add_message("System".to_string(), 
-                                    "⏳ Analyzing task for multi-instance coordination...".to_string());
-                            }
-                            
-                            // Spawn coordination in background
-                            tokio::spawn(async move {
-                                tracing::info!("Starting background coordination analysis");
-                                
-                                // Perform DeepSeek analysis in background
-                                let breakdown_prompt = format!(
-                                    r#"Break down this complex task into 2-3 parallel subtasks that can be worked on by separate Claude Code instances:
-
-Main task: "{}"
-Working directory: {}
-
-Requirements:
-1. Each subtask should be independent and workable in parallel
-2. Subtasks should be specific and actionable
-3. Include file/directory scope for each subtask to avoid conflicts
-4. Ensure subtasks contribute to the overall goal
-
-Format your response as:
-SUBTASK_1: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]
-SUBTASK_2: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]  
-SUBTASK_3: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]
-
-Response:"#,
-                                    task_desc_clone,
-                                    current_dir
-                                );
-                                
-                                // Perform the analysis (this might take time but won't block UI)
-                                match perform_gemma_analysis(&breakdown_prompt).await {
-                                    Ok(breakdown) => {
-                                        tracing::info!("Auto-coordination analysis completed, sending InternalCoordinateInstances message");
-                                        if let Err(e) = tx.send(ClaudeMessage::InternalCoordinateInstances {
-                                            main_instance_id,
-                                            task_description: breakdown,
-                                            num_instances: 0, // Use default count for auto-coordination
-                                            working_dir: current_dir,
-                                            is_ipc: false,
-                                        }).await {
-                                            tracing::error!("Failed to send auto-coordination InternalCoordinateInstances message: {}", e);
-                                        } else {
-                                            tracing::info!("Successfully sent auto-coordination InternalCoordinateInstances message");
-                                        }
-                                    }
-                                    Err(e) => {
-                                        tracing::error!("Background auto-coordination failed: {}", e);
-                                        if let Err(e2) = tx.send(ClaudeMessage::InternalCoordinateInstances {
-                                            main_instance_id,
-                                            task_description: "ERROR: Failed to analyze task - using single instance".to_string(),
-                                            num_instances: 0,
-                                            working_dir: current_dir,
-                                            is_ipc: false,
-                                        }).await {
-                                            tracing::error!("Failed to send auto-coordination fallback message: {}", e2);
-                                        } else {
-                                            tracing::info!("Successfully sent auto-coordination fallback message");
-                                        }
-                                    }
-                                }
-                            });
-                            
-                            return; // Don't continue with normal automode processing
-                        } else {
-                            tracing::info!("Task analysis determined coordination not beneficial");
-                        }
-                        } else {
+                        if self.coordination_in_progress {
                             tracing::debug!("Coordination already in progress, skipping automode coordination analysis");
-                        }
-                        
-                        // Continue with normal automode processing - collect more data
-                        let (had_tool_attempts, attempted_tools, session_id_opt) = {
-                            if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
-                                let had_tool_attempts = !instance.last_tool_attempts.is_empty();
-                                
-                                // Filter out tools that we know were successful - no need to check permission
-                                let attempted_tools: Vec<String> = instance.last_tool_attempts.iter()
-                                    .filter(|tool| !instance.successful_tools.contains(tool))
-                                    .cloned()
-                                    .collect();
-                                
-                                let skipped_tools: Vec<String> = instance.last_tool_attempts.iter()
-                                    .filter(|tool| instance.successful_tools.contains(tool))
-                                    .cloned()
-                                    .collect();
-                                
-                                // Clear tool attempts for next message
-                                instance.last_tool_attempts.clear();
-                                
-                                // Add system message if tools were attempted
-                                if had_tool_attempts {
-                                    if !attempted_tools.is_empty() {
-                                        instance.add_message("System".to_string(), 
-                                            format!("🤖 Automode: Checking if Claude needs permission for tools: {}", attempted_tools.join(", ")));
-                                    }
-                                    if !skipped_tools.is_empty() {
-                                        instance.add_message("System".to_string(), 
-                                            format!("✅ Automode: Skipping permission check for proven tools: {}", skipped_tools.join(", ")));
-                                    }
+                            self.run_automode_followup(main_instance_id, claude_message, user_context);
+                        } else {
+                            match self.precheck_coordination(&claude_message) {
+                                Some(true) => {
+                                    tracing::info!("Task identified for multi-instance coordination");
+                                    self.start_auto_coordination(main_instance_id, &claude_message);
+                                    coordination_pending = true;
+                                }
+                                Some(false) => self.run_automode_followup(main_instance_id, claude_message, user_context),
+                                // Ollama has to decide; the verdict arrives as CoordinationAnalysisComplete
+                                None => {
+                                    self.spawn_coordination_analysis(main_instance_id, claude_message, user_context);
+                                    coordination_pending = true;
                                 }
-                                
-                                (had_tool_attempts && !attempted_tools.is_empty(), attempted_tools, instance.session_id.clone())
-                            } else {
-                                (false, Vec::new(), None)
-                            }
-                        };
-                        
-                        // Check if automode is enabled before processing
-                        if self.auto_mode {
-                            if let Some(session_id) = session_id_opt {
-                                let tx = self.message_tx.clone();
-                                let deepseek_tx = self.deepseek_tx.clone();
-                                let claude_msg_for_permission = claude_message.clone();
-                                let user_context_for_spawn = user_context.clone();
-                                        
-                                tokio::spawn(async move {
-                                    // Only check for permission issues if there were tool attempts
-                                    if had_tool_attempts {
-                                        tracing::info!("Claude attempted to use tools: {:?}, checking for permission issues", attempted_tools);
-                                        
-                                        // Check if Claude mentioned permission issues
-                                        match check_tool_permission_issue(&claude_msg_for_permission, &attempted_tools).await {
-                                            Ok(Some(tools)) => {
-                                                tracing::info!("Automode: Claude needs permission for tools: {:?}", tools);
-                                                
-                                                // Enable each tool that Claude needs by sending ToolApproved messages
-                                                let mut enabled_tools = Vec::new();
-                                                for tool in &tools {
-                                                    // Send ToolApproved message instead of using broken claude config command
-                                                    let _ = tx.send(ClaudeMessage::ToolApproved {
-                                                        tool_name: tool.clone(),
-                                                        session_id: Some(session_id.clone()),
-                                                    }).await;
-                                                    tracing::info!("Successfully approved tool: {}", tool);
-                                                    enabled_tools.push(tool.clone());
-                                                }
-                                                
-                                                if !enabled_tools.is_empty() {
-                                                    // Send a system message to the UI
-                                                    let system_msg = format!("🔧 Automode: Enabled tools: {}", enabled_tools.join(", "));
-                                                    let _ = tx.send(ClaudeMessage::StreamText {
-                                                        text: system_msg,
-                                                        session_id: Some(session_id.clone()),
-                                                    }).await;
-                                                    
-                                                    // Send a message telling Claude the tools are now enabled
-                                                    let response = format!(
-                                                        "I've enabled the following tools for you: {}. Please try using them again.",
-                                                        enabled_tools.join(", ")
-                                                    );
-                                                    
-                                                    if let Err(e) = send_to_claude_with_session(response, tx, Some(session_id), None, None).await {
-                                                        tracing::error!("Failed to send tool enablement message to Claude: {}", e);
-                                                    }
-                                                }
-                                                return; // Don't process as regular question
-                                            }
-                                            Ok(None) => {
-                                                tracing::info!("No permission issues detected after tool attempts");
-                                            }
-                                            Err(e) => {
-                                                tracing::error!("Failed to check tool permissions: {}", e);
-                                            }
-                                        }
-                                    } else {
-                                        // No tool attempts, check if Claude is requesting coordination
-                                        let message_lower = claude_msg_for_permission.to_lowercase();
-                                        let coordination_requests = [
-                                            "spawn additional instances",
-                                            "multiple instances", 
-                                            "parallel processing",
-                                            "divide and conquer",
-                                            "coordinate with other instances",
-                                            "split this task",
-                                            "work in parallel",
-                                            "I should spawn",
-                                            "let me spawn",
-                                            "I need additional instances"
-                                        ];
-                                        
-                                        let mut coordination_requested = false;
-                                        for request in &coordination_requests {
-                                            if message_lower.contains(request) {
-                                                tracing::info!("Claude explicitly requested coordination: '{}'", request);
-                                                coordination_requested = true;
-                                                break;
-                                            }
-                                        }
-                                        
-                                        if coordination_requested {
-                                            // Send a message asking for user confirmation for coordination
-                                            let coordination_response = "I can spawn additional Claude instances to work on this task in parallel. Would you like me to proceed with multi-instance coordination?";
-                                            if let Err(e) = send_to_claude_with_session(coordination_response.to_string(), tx.clone(), Some(session_id.clone()), None, None).await {
-                                                tracing::error!("Failed to send coordination query: {}", e);
-                                            }
-                                        } else {
-                                            // Check if it's a regular question
-                                            let (is_question, _) = analyze_claude_message(&claude_msg_for_permission);
-                                            
-                                            if is_question {
-                                                tracing::info!("Automode: Claude asked a question, generating DeepSeek response");
-                                                
-                                                // Generate streaming response for UI display
-                                                tokio::spawn(async move {
-                                                    if let Err(e) = generate_deepseek_response_stream(
-                                                        &claude_msg_for_permission, 
-                                                        &user_context_for_spawn,
-                                                        deepseek_tx
-                                                    ).await {
-                                                        tracing::error!("Failed to generate DeepSeek response: {}", e);
-                                                    }
-                                                });
-                                            }
-                                        }
-                                    }
-                                });
-                            } else {
-                                tracing::warn!("No session_id available for automode processing");
                             }
-                        } else {
-                            tracing::info!("Automode is OFF");
                         }
                     } else {
                         // No claude message or user context for automode processing
                         tracing::debug!("No claude message or user context available for automode");
                     }
                     
-                    // Process message queue if this is the current tab and instance finished processing
+                    // Process message queue if this is the current tab and instance finished processing.
+                    // Hold it back while coordination starts or is being decided; the analysis
+                    // result handler releases it if no coordination follows.
                     if let Some(target_idx) = target_instance_index {
-                        if target_idx == self.current_tab && !self.message_queue.is_empty() {
+                        if !coordination_pending && target_idx == self.current_tab && !self.message_queue.is_empty() {
                             tracing::info!("Instance finished processing, checking message queue ({} messages)", self.message_queue.len());
                             self.process_message_queue().await;
                         }
@@ -2354,6 +2118,8 @@ Response:"#,
                     
                     // Set coordination in progress to prevent stall detection interference
                     self.coordination_in_progress = true;
+                    // This coordination now owns the flag; an in-flight analysis result is stale
+                    self.coordination_analysis_id = None;
                     
                     // Set a safety timeout to clear coordination flag in case something goes wrong
                     let tx_safety = self.message_tx.clone();
@@ -2526,6 +2292,45 @@ Response:"#,
                             format!("✅ Completed spawning {} instances for task", num_instances));
                     }
                 }
+                ClaudeMessage::CoordinationAnalysisComplete { analysis_id, main_instance_id, claude_message, user_context, beneficial } => {
+                    // Superseded by a newer analysis or by a directly requested coordination
+                    if self.coordination_analysis_id != Some(analysis_id) {
+                        tracing::info!("Dropping superseded coordination analysis {}", analysis_id);
+                        continue;
+                    }
+                    
+                    // This analysis still owns the flag, so it is safe to release
+                    self.coordination_analysis_id = None;
+                    self.coordination_in_progress = false;
+                    
+                    // The conversation may have moved on while Ollama was thinking: only act if
+                    // the instance is idle and its latest non-system message is still this reply
+                    let instance_idx = self.instances.iter().position(|i| i.id == main_instance_id);
+                    let still_current = instance_idx.map_or(false, |idx| {
+                        let instance = &self.instances[idx];
+                        !instance.is_processing && instance.messages.iter()
+                            .rev()
+                            .find(|m| m.sender != "System")
+                            .map_or(false, |m| m.sender == "Claude" && m.content == claude_message)
+                    });
+                    
+                    if !self.auto_mode || !still_current {
+                        tracing::info!("Dropping stale coordination analysis {} for instance {}", analysis_id, main_instance_id);
+                    } else if beneficial && self.coordination_enabled && self.instances.len() < self.max_instances {
+                        tracing::info!("Task identified for multi-instance coordination");
+                        self.start_auto_coordination(main_instance_id, &claude_message);
+                        continue;
+                    } else {
+                        tracing::info!("Task analysis determined coordination not beneficial");
+                        self.run_automode_followup(main_instance_id, claude_message, user_context);
+                    }
+                    
+                    // Release the queued messages held back at StreamEnd
+                    if instance_idx == Some(self.current_tab) && !self.message_queue.is_empty() {
+                        tracing::info!("Coordination analysis finished, checking message queue ({} messages)", self.message_queue.len());
+                        self.process_message_queue().await;
+                    }
+                }
                 ClaudeMessage::CoordinationMessage { message } => {
                     tracing::info!("Received coordination message: {:?}", message);
                     // Handle inter-Veda coordination messages
@@ -2635,14 +2440,271 @@ Response:"#,
         }
     }
 
-    async fn analyze_task_for_coordination(&mut self, claude_message: &str) -> bool {
+    /// Kick off automatic multi-instance coordination for a finished response.
+    ///
+    /// The Gemma task breakdown runs in the background and reports back as
+    /// InternalCoordinateInstances, which spawns the instances.
+    fn start_auto_coordination(&mut self, main_instance_id: Uuid, claude_message: &str) {
+        // Set coordination in progress to prevent stall detection interference
+        self.coordination_in_progress = true;
+
+        // Set a safety timeout to clear coordination flag in case something goes wrong
+        let tx_safety = self.message_tx.clone();
+        tokio::spawn(async move {
+            tokio::time::sleep(tokio::time::Duration::from_secs(300)).await; // 5 minutes safety timeout
+            tracing::warn!("Coordination timeout - clearing coordination_in_progress flag");
+            // Send a dummy message to trigger flag clearing if needed
+            let _ = tx_safety.send(ClaudeMessage::InternalCoordinateInstances {
+                main_instance_id: uuid::Uuid::new_v4(),
+                task_description: "TIMEOUT: Coordination safety timeout triggered".to_string(),
+                num_instances: 0,
+                working_dir: ".".to_string(),
+                is_ipc: false,
+            }).await;
+        });
+
+        // Clone necessary data for the background task
+        let task_desc_clone = claude_message.to_string();
+        let current_dir = if let Some(instance) = self.instances.iter().find(|i| i.id == main_instance_id) {
+            instance.working_directory.clone()
+        } else {
+            std::env::current_dir().map(|p| p.display().to_string()).unwrap_or_else(|_| ".".to_string())
+        };
+        let tx = self.message_tx.clone();
+
+        // Show processing message
+        if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
+            instance.add_message("System".to_string(), 
+                "⏳ Analyzing task for multi-instance coordination...".to_string());
+        }
+
+        // Spawn coordination in background
+        tokio::spawn(async move {
+            tracing::info!("Starting background coordination analysis");
+
+            // Perform DeepSeek analysis in background
+            let breakdown_prompt = format!(
+                r#"Break down this complex task into 2-3 parallel subtasks that can be worked on by separate Claude Code instances:
+
+Main task: "{}"
+Working directory: {}
+
+Requirements:
+1. Each subtask should be independent and workable in parallel
+2. Subtasks should be specific and actionable
+3. Include file/directory scope for each subtask to avoid conflicts
+4. Ensure subtasks contribute to the overall goal
+
+Format your response as:
+SUBTASK_1: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]
+SUBTASK_2: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]  
+SUBTASK_3: [Description] | SCOPE: [Files/directories] | PRIORITY: [High/Medium/Low]
+
+Response:"#,
+                task_desc_clone,
+                current_dir
+            );
+
+            // Perform the analysis (this might take time but won't block UI)
+            match perform_gemma_analysis(&breakdown_prompt).await {
+                Ok(breakdown) => {
+                    tracing::info!("Auto-coordination analysis completed, sending InternalCoordinateInstances message");
+                    if let Err(e) = tx.send(ClaudeMessage::InternalCoordinateInstances {
+                        main_instance_id,
+                        task_description: breakdown,
+                        num_instances: 0, // Use default count for auto-coordination
+                        working_dir: current_dir,
+                        is_ipc: false,
+                    }).await {
+                        tracing::error!("Failed to send auto-coordination InternalCoordinateInstances message: {}", e);
+                    } else {
+                        tracing::info!("Successfully sent auto-coordination InternalCoordinateInstances message");
+                    }
+                }
+                Err(e) => {
+                    tracing::error!("Background auto-coordination failed: {}", e);
+                    if let Err(e2) = tx.send(ClaudeMessage::InternalCoordinateInstances {
+                        main_instance_id,
+                        task_description: "ERROR: Failed to analyze task - using single instance".to_string(),
+                        num_instances: 0,
+                        working_dir: current_dir,
+                        is_ipc: false,
+                    }).await {
+                        tracing::error!("Failed to send auto-coordination fallback message: {}", e2);
+                    } else {
+                        tracing::info!("Successfully sent auto-coordination fallback message");
+                    }
+                }
+            }
+        });
+    }
+    
+    /// Automode handling for a finished Claude response: tool permission
+    /// checks, coordination requests and DeepSeek answers to questions.
+    fn run_automode_followup(&mut self, main_instance_id: Uuid, claude_message: String, user_context: String) {
+        let (had_tool_attempts, attempted_tools, session_id_opt) = {
+            if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
+                let had_tool_attempts = !instance.last_tool_attempts.is_empty();
+
+                // Filter out tools that we know were successful - no need to check permission
+                let attempted_tools: Vec<String> = instance.last_tool_attempts.iter()
+                    .filter(|tool| !instance.successful_tools.contains(tool))
+                    .cloned()
+                    .collect();
+
+                let skipped_tools: Vec<String> = instance.last_tool_attempts.iter()
+                    .filter(|tool| instance.successful_tools.contains(tool))
+                    .cloned()
+                    .collect();
+
+                // Clear tool attempts for next message
+                instance.last_tool_attempts.clear();
+
+                // Add system message if tools were attempted
+                if had_tool_attempts {
+                    if !attempted_tools.is_empty() {
+                        instance.add_message("System".to_string(), 
+                            format!("🤖 Automode: Checking if Claude needs permission for tools: {}", attempted_tools.join(", ")));
+                    }
+                    if !skipped_tools.is_empty() {
+                        instance.add_message("System".to_string(), 
+                            format!("✅ Automode: Skipping permission check for proven tools: {}", skipped_tools.join(", ")));
+                    }
+                }
+
+                (had_tool_attempts && !attempted_tools.is_empty(), attempted_tools, instance.session_id.clone())
+            } else {
+                (false, Vec::new(), None)
+            }
+        };
+
+        // Check if automode is enabled before processing
+        if self.auto_mode {
+            if let Some(session_id) = session_id_opt {
+                let tx = self.message_tx.clone();
+                let deepseek_tx = self.deepseek_tx.clone();
+                let claude_msg_for_permission = claude_message.clone();
+                let user_context_for_spawn = user_context.clone();
+
+                tokio::spawn(async move {
+                    // Only check for permission issues if there were tool attempts
+                    if had_tool_attempts {
+                        tracing::info!("Claude attempted to use tools: {:?}, checking for permission issues", attempted_tools);
+
+                        // Check if Claude mentioned permission issues
+                        match check_tool_permission_issue(&claude_msg_for_permission, &attempted_tools).await {
+                            Ok(Some(tools)) => {
+                                tracing::info!("Automode: Claude needs permission for tools: {:?}", tools);
+
+                                // Enable each tool that Claude needs by sending ToolApproved messages
+                                let mut enabled_tools = Vec::new();
+                                for tool in &tools {
+                                    // Send ToolApproved message instead of using broken claude config command
+                                    let _ = tx.send(ClaudeMessage::ToolApproved {
+                                        tool_name: tool.clone(),
+                                        session_id: Some(session_id.clone()),
+                                    }).await;
+                                    tracing::info!("Successfully approved tool: {}", tool);
+                                    enabled_tools.push(tool.clone());
+                                }
+
+                                if !enabled_tools.is_empty() {
+                                    // Send a system message to the UI
+                                    let system_msg = format!("🔧 Automode: Enabled tools: {}", enabled_tools.join(", "));
+                                    let _ = tx.send(ClaudeMessage::StreamText {
+                                        text: system_msg,
+                                        session_id: Some(session_id.clone()),
+                                    }).await;
+
+                                    // Send a message telling Claude the tools are now enabled
+                                    let response = format!(
+                                        "I've enabled the following tools for you: {}. Please try using them again.",
+                                        enabled_tools.join(", ")
+                                    );
+
+                                    if let Err(e) = send_to_claude_with_session(response, tx, Some(session_id), None, None).await {
+                                        tracing::error!("Failed to send tool enablement message to Claude: {}", e);
+                                    }
+                                }
+                                return; // Don't process as regular question
+                            }
+                            Ok(None) => {
+                                tracing::info!("No permission issues detected after tool attempts");
+                            }
+                            Err(e) => {
+                                tracing::error!("Failed to check tool permissions: {}", e);
+                            }
+                        }
+                    } else {
+                        // No tool attempts, check if Claude is requesting coordination
+                        let message_lower = claude_msg_for_permission.to_lowercase();
+                        let coordination_requests = [
+                            "spawn additional instances",
+                            "multiple instances", 
+                            "parallel processing",
+                            "divide and conquer",
+                            "coordinate with other instances",
+                            "split this task",
+                            "work in parallel",
+                            "I should spawn",
+                            "let me spawn",
+                            "I need additional instances"
+                        ];
+
+                        let mut coordination_requested = false;
+                        for request in &coordination_requests {
+                            if message_lower.contains(request) {
+                                tracing::info!("Claude explicitly requested coordination: '{}'", request);
+                                coordination_requested = true;
+                                break;
+                            }
+                        }
+
+                        if coordination_requested {
+                            // Send a message asking for user confirmation for coordination
+                            let coordination_response = "I can spawn additional Claude instances to work on this task in parallel. Would you like me to proceed with multi-instance coordination?";
+                            if let Err(e) = send_to_claude_with_session(coordination_response.to_string(), tx.clone(), Some(session_id.clone()), None, None).await {
+                                tracing::error!("Failed to send coordination query: {}", e);
+                            }
+                        } else {
+                            // Check if it's a regular question
+                            let (is_question, _) = analyze_claude_message(&claude_msg_for_permission);
+
+                            if is_question {
+                                tracing::info!("Automode: Claude asked a question, generating DeepSeek response");
+
+                                // Generate streaming response for UI display
+                                tokio::spawn(async move {
+                                    if let Err(e) = generate_deepseek_response_stream(
+                                        &claude_msg_for_permission, 
+                                        &user_context_for_spawn,
+                                        deepseek_tx
+                                    ).await {
+                                        tracing::error!("Failed to generate DeepSeek response: {}", e);
+                                    }
+                                });
+                            }
+                        }
+                    }
+                });
+            } else {
+                tracing::warn!("No session_id available for automode processing");
+            }
+        } else {
+            tracing::info!("Automode is OFF");
+        }
+    }
+    
+    /// Cheap local checks that settle whether a task needs coordination
+    /// without asking Ollama. Returns None when the model has to decide.
+    fn precheck_coordination(&self, claude_message: &str) -> Option<bool> {
         if !self.coordination_enabled {
-            return false;
+            return Some(false);
         }
         
         if self.instances.len() >= self.max_instances {
             tracing::debug!("Already at max instances ({}), skipping coordination", self.max_instances);
-            return false;
+            return Some(false);
         }
         
         // Check for explicit coordination requests first
@@ -2660,14 +2722,54 @@ Response:"#,
         for keyword in &explicit_keywords {
             if message_lower.contains(keyword) {
                 tracing::info!("Explicit coordination request detected: '{}'", keyword);
-                return true;
+                return Some(true);
             }
         }
         
-        // Gather context for comprehensive analysis
+        None
+    }
+    
+    /// Run the Ollama coordination analysis off the UI loop.
+    ///
+    /// The conversation is snapshotted here; building the prompt (including the
+    /// TaskMaster file reads) and the model call run in a background task that
+    /// reports back as CoordinationAnalysisComplete, so frames keep drawing.
+    fn spawn_coordination_analysis(&mut self, main_instance_id: Uuid, claude_message: String, user_context: String) {
+        // Set before spawning so the stall detector and a second StreamEnd
+        // cannot start a duplicate analysis while this one is in flight.
+        // The id lets the result handler tell whether it still owns the flag.
+        let analysis_id = Uuid::new_v4();
+        self.coordination_analysis_id = Some(analysis_id);
+        self.coordination_in_progress = true;
+        
+        if let Some(instance) = self.instances.iter_mut().find(|i| i.id == main_instance_id) {
+            instance.add_message("System".to_string(), 
+                "🤖 Analyzing if task would benefit from multi-instance coordination...".to_string());
+        }
+        
         let initial_user_prompt = self.get_initial_user_prompt();
         let recent_conversation = self.get_recent_conversation_context();
-        let taskmaster_context = self.get_taskmaster_context().await;
+        let working_dir = self.current_instance()
+            .map_or_else(|| ".".to_string(), |i| i.working_directory.clone());
+        let tx = self.message_tx.clone();
+        tokio::spawn(async move {
+            let analysis_prompt = Self::build_coordination_analysis_prompt(initial_user_prompt, recent_conversation, &working_dir).await;
+            let beneficial = Self::analyze_task_for_coordination(&analysis_prompt).await;
+            if let Err(e) = tx.send(ClaudeMessage::CoordinationAnalysisComplete {
+                analysis_id,
+                main_instance_id,
+                claude_message,
+                user_context,
+                beneficial,
+            }).await {
+                tracing::error!("Failed to send coordination analysis result: {}", e);
+            }
+        });
+    }
+    
+    async fn build_coordination_analysis_prompt(initial_user_prompt: Option<String>, recent_conversation: String, working_dir: &str) -> String {
+        // Gather context for comprehensive analysis
+        let taskmaster_context = Self::get_taskmaster_context(working_dir).await;
         
         // Use Ollama analysis (not the entire conversation, just recent context + initial prompt)
         tracing::info!("Analyzing coordination potential with Ollama - Recent conversation: {} chars, Initial prompt: {} chars, TaskMaster: {} chars", 
@@ -2675,7 +2777,7 @@ Response:"#,
                       initial_user_prompt.as_ref().map_or(0, |s| s.len()),
                       taskmaster_context.len());
         
-        let analysis_prompt = format!(
+        format!(
             r#"Analyze if this task would benefit from multiple parallel Claude Code instances working together.
 
 INITIAL USER REQUEST:
@@ -2716,11 +2818,13 @@ Your response:"#,
             initial_prompt = initial_user_prompt.as_ref().map_or("No initial prompt found".to_string(), |p| p.clone()),
             recent_conversation = recent_conversation,
             taskmaster_state = taskmaster_context
-        );
-        
+        )
+    }
+    
+    async fn analyze_task_for_coordination(analysis_prompt: &str) -> bool {
         // Quick local analysis using Ollama/Gemma with timeout protection
         let analysis_timeout = tokio::time::Duration::from_secs(60); // Allow up to 60 seconds for analysis
-        match tokio::time::timeout(analysis_timeout, self.quick_deepseek_analysis(&analysis_prompt)).await {
+        match tokio::time::timeout(analysis_timeout, Self::quick_deepseek_analysis(analysis_prompt)).await {
             Ok(Ok(response)) => {
                 tracing::info!("Ollama coordination analysis response: {}", response);
                 if response.contains("COORDINATE_BENEFICIAL") {
@@ -2778,14 +2882,9 @@ Your response:"#,
         }
     }
 
-    async fn get_taskmaster_context(&self) -> String {
+    async fn get_taskmaster_context(working_dir: &str) -> String {
         // Try to get current TaskMaster tasks for context
         // This is a basic implementation - in practice, you might want to use MCP tools
-        let working_dir = if let Some(instance) = self.current_instance() {
-            &instance.working_directory
-        } else {
-            "."
-        };
 
         // Check if there's a tasks.json file we can read
         let tasks_path = format!("{}/tasks/tasks.json", working_dir);
@@ -2834,14 +2933,14 @@ Your response:"#,
     }
     
     
-    async fn quick_deepseek_analysis(&self, prompt: &str) -> Result<String> {
+    async fn quick_deepseek_analysis(prompt: &str) -> Result<String> {
         let request_body = serde_json::json!({
             "model": "gemma3:12b",
             "prompt": prompt,
             "stream": false
         });
         
-        let client = reqwest::Client::new();
+        let client = crate::deepseek::http_client();
         
         // Retry up to 10 times with exponential backoff
         let mut retry_count = 0;
@@ -3597,7 +3696,7 @@ async fn perform_gemma_analysis(prompt: &str) -> Result<String> {
         }
     });
     
-    let client = reqwest::Client::new();
+    let client = crate::deepseek::http_client();
     
     // Enhanced retry with exponential backoff - more aggressive retry for critical spawning
     let mut retry_count = 0;
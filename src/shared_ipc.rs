@@ -1,5 +1,6 @@
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
+use std::time::Duration;
 use tokio::sync::RwLock;
 use tokio::net::{UnixListener, UnixStream};
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
@@ -7,10 +8,17 @@ use serde::{Deserialize, Serialize};
 use serde_json::json;
 use anyhow::Result;
 use tracing::{info, error, warn};
-use uuid;
 
 /// Get the appropriate socket path for the current OS
+///
+/// The path is resolved once per process; every registry request goes
+/// through here, so this avoids re-probing /run/user on each call.
 pub fn get_socket_path() -> String {
+    static SOCKET_PATH: OnceLock<String> = OnceLock::new();
+    SOCKET_PATH.get_or_init(resolve_socket_path).clone()
+}
+
+fn resolve_socket_path() -> String {
     #[cfg(target_os = "macos")]
     {
         // On macOS, use /tmp which is standard and accessible
@@ -345,13 +353,27 @@ async fn handle_registry_connection(
     }
 }
 
+/// Upper bound on a single registry round-trip so a wedged registry
+/// process cannot stall the caller indefinitely
+const REGISTRY_TIMEOUT: Duration = Duration::from_secs(5);
+
 /// Client for connecting to the shared registry
 pub struct RegistryClient;
 
 impl RegistryClient {
     pub async fn send_command(command: RegistryCommand) -> Result<RegistryResponse> {
-        let socket_path = get_socket_path();
-        let mut socket = UnixStream::connect(&socket_path).await?;
+        Self::send_command_to(&get_socket_path(), command).await
+    }
+    
+    /// Send a command to the registry listening on `socket_path`
+    pub async fn send_command_to(socket_path: &str, command: RegistryCommand) -> Result<RegistryResponse> {
+        tokio::time::timeout(REGISTRY_TIMEOUT, Self::round_trip(socket_path, command))
+            .await
+            .map_err(|_| anyhow::anyhow!("Registry request timed out after {:?}", REGISTRY_TIMEOUT))?
+    }
+    
+    async fn round_trip(socket_path: &str, command: RegistryCommand) -> Result<RegistryResponse> {
+        let mut socket = UnixStream::connect(socket_path).await?;
         
         let command_json = serde_json::to_string(&command)?;
         socket.write_all(command_json.as_bytes()).await?;
@@ -230,4 +230,33 @@ mod ipc_tests {
         assert_eq!(msg["session_id"], "test-session");
         assert_eq!(msg["instance_name"], "Claude 2-A");
     }
-}
\ No newline at end of file
+
+    #[tokio::test(start_paused = true)]
+    async fn test_registry_client_times_out_on_silent_server() {
+        use veda_tui::shared_ipc::{RegistryClient, RegistryCommand};
+
+        let socket_path = "/tmp/veda-test-registry-timeout.sock";
+        let _ = std::fs::remove_file(socket_path);
+        let listener = UnixListener::bind(socket_path).unwrap();
+
+        // Accept the connection but never send a response
+        let server = tokio::spawn(async move {
+            let (stream, _) = listener.accept().await.unwrap();
+            tokio::time::sleep(Duration::from_secs(60)).await;
+            drop(stream);
+        });
+
+        let command = RegistryCommand {
+            command: "get".to_string(),
+            session_id: "test-session-timeout".to_string(),
+            value: None,
+        };
+        let result = RegistryClient::send_command_to(socket_path, command).await;
+
+        let error = result.expect_err("silent registry should time out");
+        assert!(error.to_string().contains("timed out"), "unexpected error: {}", error);
+
+        server.abort();
+        let _ = std::fs::remove_file(socket_path);
+    }
+}